@@ -35,6 +35,8 @@ def main(
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file path (default: stdout)"),
     json_output: bool = typer.Option(False, "--json", "-j", help="Output in JSON format"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress progress output"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Don't read or write the symbol cache"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show per-parser and per-symbol diagnostics"),
 ):
     """Git-enabled, cross-language code analysis with tree-sitter.
     
@@ -80,7 +82,10 @@ def main(
             repo_path=path,
             language_filter=languages,
             max_files=max_files,
-            max_lines=max_lines
+            max_lines=max_lines,
+            use_cache=not no_cache,
+            verbose=verbose,
+            show_progress=not quiet
         )
         
         # Format output - always group by structure now
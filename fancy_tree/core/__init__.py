@@ -14,6 +14,7 @@ from .discovery import (
 )
 from .extraction import (
     extract_symbols_generic,
+    extract_symbols_from_bytes,
     extract_symbols_from_file,
     process_repository,
     get_parser_for_language
@@ -36,6 +37,7 @@ __all__ = [
     "get_repository_info",
     # Extraction
     "extract_symbols_generic",
+    "extract_symbols_from_bytes",
     "extract_symbols_from_file",
     "process_repository",
     "get_parser_for_language",
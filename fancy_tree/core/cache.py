@@ -0,0 +1,83 @@
+"""On-disk cache of extracted symbols, keyed by file contents."""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+from .. import __version__
+from ..schema import Symbol
+from .config import LanguageConfig
+
+
+def get_cache_dir() -> Path:
+    """Get the symbol cache directory ($FANCY_TREE_CACHE_DIR or the user cache)."""
+    cache_dir = os.environ.get("FANCY_TREE_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "fancy_tree"
+
+
+def cache_key(source_bytes: bytes, config: LanguageConfig) -> str:
+    """
+    Hash file contents together with everything that shapes extraction.
+
+    The package version and the language's full extraction config (node
+    types, name nodes, signature templates and symbol query) are part of the
+    key, so upgrading fancy_tree or editing the language in languages.yaml
+    invalidates old entries.
+    """
+    config_state = {
+        "language": config.language,
+        "class_nodes": sorted(config.class_nodes),
+        "function_nodes": sorted(config.function_nodes),
+        "interface_nodes": sorted(config.interface_nodes),
+        "name_nodes": sorted(config.name_nodes),
+        "signature_templates": config.signature_templates,
+        "symbol_query": config.symbol_query,
+    }
+
+    digest = hashlib.sha256()
+    digest.update(__version__.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(json.dumps(config_state, sort_keys=True).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(source_bytes)
+    return digest.hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    """Path of the cache entry for *key*, fanned out over subdirectories."""
+    return get_cache_dir() / key[:2] / f"{key}.json"
+
+
+def load_symbols(key: str) -> Optional[List[Symbol]]:
+    """Return cached symbols for *key*, or None on a miss or unreadable entry."""
+    try:
+        with open(_entry_path(key), 'r', encoding='utf-8') as f:
+            return [Symbol.from_dict(data) for data in json.load(f)]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def store_symbols(key: str, symbols: List[Symbol]) -> None:
+    """Write symbols for *key*; failures are ignored since the cache is optional."""
+    entry_path = _entry_path(key)
+    try:
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temp file and rename so concurrent readers never see partial JSON
+        fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump([symbol.to_dict() for symbol in symbols], f, ensure_ascii=False)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
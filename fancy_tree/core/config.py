@@ -16,14 +16,27 @@ class LanguageConfig:
     def __init__(self, language: str, config_dict: Dict[str, Any]):
         self.language = language
         self.extensions = config_dict.get("extensions", [])
-        self.function_nodes = config_dict.get("function_nodes", [])
-        self.class_nodes = config_dict.get("class_nodes", [])
-        self.interface_nodes = config_dict.get("interface_nodes", [])
-        self.name_nodes = config_dict.get("name_nodes", ["identifier"])
+        # Node type sets are checked against every AST node, so keep them hashed
+        self.function_nodes = frozenset(config_dict.get("function_nodes", []))
+        self.class_nodes = frozenset(config_dict.get("class_nodes", []))
+        self.interface_nodes = frozenset(config_dict.get("interface_nodes", []))
+        self.name_nodes = frozenset(config_dict.get("name_nodes", ["identifier"]))
+        self.symbol_query = config_dict.get("symbol_query") or self._build_symbol_query()
         self.signature_templates = config_dict.get("signature_templates", {})
         self.tree_sitter_package = config_dict.get("tree_sitter_package", f"tree-sitter-{language}")
         self.language_function = config_dict.get("language_function", "language")
     
+    def _build_symbol_query(self) -> str:
+        """Build a tree-sitter query capturing class nodes as @class and function nodes as @function."""
+        patterns = []
+        class_nodes = sorted(self.class_nodes)
+        function_nodes = sorted(self.function_nodes - self.class_nodes)
+        if class_nodes:
+            patterns.append("[" + " ".join(f"({t})" for t in class_nodes) + "] @class")
+        if function_nodes:
+            patterns.append("[" + " ".join(f"({t})" for t in function_nodes) + "] @function")
+        return "\n".join(patterns)
+    
     def get_template(self, symbol_type: str) -> str:
         """Get signature template for symbol type with fallback."""
         return self.signature_templates.get(symbol_type, f"{symbol_type} {{name}}")
@@ -124,12 +124,18 @@ def classify_files(
 def count_lines(file_path: Path) -> int:
     """Count lines in a file safely."""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            return len(f.readlines())
+        return count_lines_in_bytes(file_path.read_bytes())
     except Exception:
         return 0
 
 
+def count_lines_in_bytes(source_bytes: bytes) -> int:
+    """Count lines in already-read file contents."""
+    if not source_bytes:
+        return 0
+    return source_bytes.count(b'\n') + (0 if source_bytes.endswith(b'\n') else 1)
+
+
 def filter_files_by_language(files: List[Path], target_languages: List[str]) -> List[Path]:
     """Filter files to include only specific languages."""
     if not target_languages:
@@ -198,8 +204,14 @@ def get_repository_info(repo_path: Path) -> Dict[str, any]:
 def scan_repository(repo_path: Path, 
                    language_filter: Optional[List[str]] = None,
                    max_files: Optional[int] = None,
-                   include_ignored: bool = False) -> Dict[str, any]:
-    """Complete repository scan with classification and filtering."""
+                   include_ignored: bool = False,
+                   count_total_lines: bool = True) -> Dict[str, any]:
+    """
+    Complete repository scan with classification and filtering.
+    
+    With ``count_total_lines=False`` files aren't read and ``total_lines`` is
+    None; callers that read every file anyway can sum the lines themselves.
+    """
     
     console.print(f"Scanning repository: {repo_path}")
     
@@ -226,9 +238,9 @@ def scan_repository(repo_path: Path,
     classified_files = classify_files(all_files)
     
     # Calculate statistics
-    total_lines = 0
-    for file_path in all_files:
-        total_lines += count_lines(file_path)
+    total_lines = None
+    if count_total_lines:
+        total_lines = sum(count_lines(file_path) for file_path in all_files)
     
     return {
         "repo_info": repo_info,
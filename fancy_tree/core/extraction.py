@@ -2,29 +2,61 @@
 
 from __future__ import annotations
 
+import heapq
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Tuple, Union
 from rich.console import Console
+from rich.progress import Progress
 from tree_sitter import Parser, Language
 
+try:
+    from tree_sitter import Query  # tree-sitter >= 0.23
+except ImportError:
+    Query = None
+
+try:
+    from tree_sitter import QueryCursor  # tree-sitter >= 0.25
+except ImportError:
+    QueryCursor = None
+
 # Change relative imports to absolute imports
 from ..schema import Symbol, SymbolType, FileInfo, DirectoryInfo, RepoSummary
-from ..extractors import get_signature_extractor
+from ..extractors import SIGNATURE_SUPPORTED_LANGUAGES, get_signature_extractor
+from .cache import cache_key, load_symbols, store_symbols
 from .config import get_language_config
-from .discovery import scan_repository, count_lines
+from .discovery import scan_repository, count_lines, count_lines_in_bytes
 
 console = Console()
 
-# Parser cache to avoid recreating parsers
+# Per-process parser and query caches: neither can be pickled, so every
+# worker process builds its own
 _parser_cache: Dict[str, Optional[Parser]] = {}
+_query_cache: Dict[str, Optional[Any]] = {}
+
+# Languages are immutable, so one load per process serves every parser
+_language_cache: Dict[str, Optional[Language]] = {}
+
+# Binding API variant that worked on first use, e.g. {"parser": "constructor"}
+_api_probe_cache: Dict[str, str] = {}
 
+# Smallest total source size worth starting a process pool for, by start
+# method. Pool startup measured ~10 ms with fork and ~300 ms with spawn, and
+# parsing runs at ~0.25 us per byte, so even with two workers the pool only
+# pays for itself once parsing would take about twice its startup time.
+POOL_MIN_BYTES = {"fork": 128 * 1024, "forkserver": 3 * 1024 * 1024, "spawn": 3 * 1024 * 1024}
 
-def parse_tree(parser: Parser, source_code: str):
+
+def parse_tree(parser: Parser, source: Union[str, bytes]):
     """Parse source across tree-sitter APIs that accept either str or bytes."""
     try:
-        return parser.parse(source_code)
+        return parser.parse(source)
     except TypeError:
-        return parser.parse(source_code.encode("utf-8"))
+        if isinstance(source, bytes):
+            raise
+        return parser.parse(source.encode("utf-8"))
 
 
 def root_node(tree):
@@ -56,6 +88,12 @@ def node_children(node) -> list:
     return [node.child(i) for i in range(child_count)]
 
 
+def cursor_node(cursor):
+    """Return the cursor's current node across property and callable APIs."""
+    node = cursor.node
+    return node() if callable(node) else node
+
+
 def node_start_line(node) -> int:
     """Return the 1-based start line across point/position APIs."""
     point = getattr(node, "start_point", None)
@@ -82,128 +120,331 @@ def node_end_byte(node) -> int:
     return end_byte() if callable(end_byte) else end_byte
 
 
-def node_text(node, source_code: str) -> str:
+def node_text(node, source: Union[str, bytes]) -> str:
     """Return node text by slicing UTF-8 bytes with tree-sitter byte offsets."""
-    source_bytes = source_code.encode("utf-8")
-    return source_bytes[node_start_byte(node):node_end_byte(node)].decode("utf-8")
+    source_bytes = source.encode("utf-8") if isinstance(source, str) else source
+    return source_bytes[node_start_byte(node):node_end_byte(node)].decode("utf-8", "replace")
 
 
-def get_parser_for_language(language: str) -> Optional[Parser]:
-    """Get tree-sitter parser using tree-sitter-language-pack."""
-    if language in _parser_cache:
-        return _parser_cache[language]
+def get_language_object(language: str, verbose: bool = False) -> Optional[Language]:
+    """Get the tree-sitter Language from tree-sitter-language-pack, loading it once per process."""
+    if language in _language_cache:
+        return _language_cache[language]
     
     try:
         # Use the better maintained tree-sitter-language-pack
-        from tree_sitter_language_pack import get_parser
+        from tree_sitter_language_pack import get_language
         
-        # This gives us a ready-to-use parser!
-        parser = get_parser(language)
-        
-        _parser_cache[language] = parser
-        console.print(f"Loaded parser for {language}")
-        return parser
+        language_obj = get_language(language)
+        if verbose:
+            console.print(f"Loaded parser for {language}")
         
     except Exception as e:
         console.print(f"ERROR: Parser failed for {language}: {e}")
         console.print(f"    Try: pip install tree-sitter-language-pack")
-        _parser_cache[language] = None
-        return None
+        language_obj = None
+    
+    _language_cache[language] = language_obj
+    return language_obj
+
+
+def _new_parser(language_obj: Language) -> Parser:
+    """Build a parser, replaying whichever Parser API worked the first time."""
+    variant = _api_probe_cache.get("parser")
+    if variant == "constructor":
+        return Parser(language_obj)
+    if variant == "set_language":
+        parser = Parser()
+        parser.set_language(language_obj)
+        return parser
+    
+    try:
+        # tree-sitter >= 0.22
+        parser = Parser(language_obj)
+        variant = "constructor"
+    except TypeError:
+        parser = Parser()
+        parser.set_language(language_obj)
+        variant = "set_language"
+    
+    _api_probe_cache["parser"] = variant
+    return parser
+
+
+def get_parser_for_language(language: str, verbose: bool = False) -> Optional[Parser]:
+    """Get tree-sitter parser using tree-sitter-language-pack."""
+    if language in _parser_cache:
+        return _parser_cache[language]
+    
+    parser = None
+    language_obj = get_language_object(language, verbose)
+    if language_obj is not None:
+        try:
+            parser = _new_parser(language_obj)
+        except Exception as e:
+            # e.g. a grammar built for an incompatible tree-sitter ABI
+            console.print(f"ERROR: Parser failed for {language}: {e}")
+            _language_cache[language] = None
+    
+    _parser_cache[language] = parser
+    return parser
+
+
+def get_query_for_language(language: str, config, verbose: bool = False) -> Optional[Any]:
+    """Get the compiled symbol query for a language, or None if it won't compile."""
+    if language in _query_cache:
+        return _query_cache[language]
+    
+    query = None
+    language_obj = get_language_object(language, verbose)
+    if config.symbol_query and language_obj is not None:
+        try:
+            if Query is not None:
+                query = Query(language_obj, config.symbol_query)
+            else:
+                query = language_obj.query(config.symbol_query)
+        except Exception as e:
+            # Node types the grammar doesn't know; fall back to walking the tree
+            if verbose:
+                console.print(f"WARNING: Symbol query unavailable for {language}: {e}")
+            query = None
+    
+    _query_cache[language] = query
+    return query
+
+
+def query_captures(query, node) -> List[Tuple[Any, str]]:
+    """Return (node, capture_name) pairs across list, dict and QueryCursor APIs."""
+    if QueryCursor is not None:
+        captures = QueryCursor(query).captures(node)
+    else:
+        captures = query.captures(node)
+    if isinstance(captures, dict):
+        return [(captured, name) for name, nodes in captures.items() for captured in nodes]
+    return list(captures)
 
 
 def extract_symbols_generic(source_code: str, language: str) -> List[Symbol]:
     """Generic symbol extraction using your proven pattern."""
+    return extract_symbols_from_bytes(source_code.encode("utf-8"), language)
+
+
+def extract_symbols_from_bytes(source_bytes: bytes, language: str, use_cache: bool = False,
+                               verbose: bool = False) -> List[Symbol]:
+    """Extract symbols from UTF-8 source bytes, as read straight from disk."""
     config = get_language_config(language)
-    parser = get_parser_for_language(language)
+    parser = get_parser_for_language(language, verbose)
     if not config or not parser:
         return []
+
+    # Binary reads skip the universal-newline translation of text mode, so
+    # normalize here to keep \r out of signatures
+    if b"\r" in source_bytes:
+        source_bytes = source_bytes.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+    if not use_cache:
+        return _extract_symbols(source_bytes, language, config, parser, verbose)
     
+    # Unchanged contents skip tree-sitter entirely
+    key = cache_key(source_bytes, config)
+    symbols = load_symbols(key)
+    if symbols is None:
+        symbols = _extract_symbols(source_bytes, language, config, parser, verbose)
+        store_symbols(key, symbols)
+    return symbols
+
+
+def _extract_symbols(source_bytes: bytes, language: str, config, parser: Parser,
+                     verbose: bool = False) -> List[Symbol]:
+    """Parse source bytes and extract their symbols."""
     extractor = get_signature_extractor(language)
     
-    # Parse source
-    tree = parse_tree(parser, source_code)
+    # Tree-sitter works in byte offsets, so slice bytes from here on
+    tree = parse_tree(parser, source_bytes)
+    
+    # Let tree-sitter find the symbol nodes in C; walk the tree in Python otherwise
+    query = get_query_for_language(language, config, verbose)
+    if query is not None:
+        try:
+            captures = query_captures(query, root_node(tree))
+        except Exception as e:
+            if verbose:
+                console.print(f"WARNING: Symbol query failed for {language}: {e}")
+        else:
+            return _symbols_from_captures(captures, source_bytes, config, extractor, language, verbose)
+    
+    walker = get_walker_for_language(language)
+    return walker(tree, source_bytes, config, extractor, language, verbose)
+
+
+def _symbols_from_captures(captures, source_bytes: bytes, config, extractor, language: str,
+                           verbose: bool = False) -> List[Symbol]:
+    """
+    Assemble nested symbols from a flat list of query captures.
+
+    Captures are ordered by start byte (outermost first), and a stack of
+    enclosing byte ranges recovers the nesting the tree walk would produce.
+    A symbol whose name can't be extracted hides everything inside it.
+    Only @class and @function captures are symbols; any other capture in a
+    custom symbol_query is ignored.
+    """
     symbols = []
     
-    def visit_node(node, parent_symbols=None, inside_class=False):
+    # Drop duplicates (a node type listed as both class and function is a class)
+    by_node = {}
+    for node, capture_name in captures:
+        if capture_name not in ("class", "function"):
+            continue
+        key = (node_start_byte(node), node_end_byte(node), node_type(node))
+        if key not in by_node or capture_name == "class":
+            by_node[key] = (node, capture_name)
+    ordered = sorted(by_node.items(), key=lambda item: (item[0][0], -item[0][1]))
+    
+    # (end_byte, children or None if skipped, inside_class) of enclosing symbols
+    stack = [(float("inf"), symbols, False)]
+    for (start_byte, end_byte, _), (node, capture_name) in ordered:
+        while start_byte >= stack[-1][0] or end_byte > stack[-1][0]:
+            stack.pop()
+        
+        parent_symbols, inside_class = stack[-1][1], stack[-1][2]
         if parent_symbols is None:
-            parent_symbols = symbols
+            continue
         
-        # Use configuration to check node types
-        current_type = node_type(node)
+        if capture_name == "class":
+            symbol = _extract_class_symbol(node, source_bytes, config, extractor, language, verbose)
+            child_inside_class = True
+        else:
+            symbol = _extract_function_symbol(node, source_bytes, config, extractor, language, inside_class, verbose)
+            child_inside_class = inside_class
+        
+        if symbol:
+            parent_symbols.append(symbol)
+            stack.append((end_byte, symbol.children, child_inside_class))
+        else:
+            stack.append((end_byte, None, inside_class))
+    
+    return symbols
 
-        if current_type in config.class_nodes:
-            class_symbol = _extract_class_symbol(node, source_code, config, extractor, language)
+
+# Source of the per-language cursor walk. The node-type checks are filled in
+# by get_walker_for_language so each language gets its own straight-line
+# comparisons instead of set lookups against the config on every node.
+_WALKER_TEMPLATE = """
+def walk(tree, source_bytes, config, extractor, language, verbose):
+    symbols = []
+    
+    # Iterative cursor walk: one (parent_symbols, inside_class) entry per depth
+    cursor = tree.walk()
+    stack = [(symbols, False)]
+    while True:
+        node = cursor_node(cursor)
+        parent_symbols, inside_class = stack[-1]
+        t = node_type(node)
+        child_context = None
+        
+        if {class_test}:
+            class_symbol = _extract_class_symbol(node, source_bytes, config, extractor, language, verbose)
             if class_symbol:
                 parent_symbols.append(class_symbol)
-                # Recurse with class_symbol.children as parent
-                for child in node_children(node):
-                    visit_node(child, class_symbol.children, inside_class=True)
+                child_context = (class_symbol.children, True)
         
-        elif current_type in config.function_nodes:
-            function_symbol = _extract_function_symbol(node, source_code, config, extractor, language, inside_class)
+        elif {function_test}:
+            function_symbol = _extract_function_symbol(node, source_bytes, config, extractor, language, inside_class, verbose)
             if function_symbol:
                 parent_symbols.append(function_symbol)
-                # Recurse with function_symbol.children as parent
-                for child in node_children(node):
-                    visit_node(child, function_symbol.children, inside_class)
+                child_context = (function_symbol.children, inside_class)
         
         else:
-            # Continue traversing with same parent_symbols
-            for child in node_children(node):
-                visit_node(child, parent_symbols, inside_class)
+            child_context = (parent_symbols, inside_class)
+        
+        if child_context is not None and cursor.goto_first_child():
+            stack.append(child_context)
+            continue
+        
+        # No children to visit: advance to the next sibling, backtracking as needed
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                return symbols
+            stack.pop()
+"""
+
+# Generated walkers, keyed by language
+_walker_cache: Dict[str, Callable] = {}
+
+
+def _node_type_test(node_types) -> str:
+    """Render a chain of ``t == '...'`` comparisons for the walker template."""
+    if not node_types:
+        return "False"
+    return " or ".join(f"t == {node_kind!r}" for node_kind in sorted(node_types))
+
+
+def get_walker_for_language(language: str) -> Optional[Callable]:
+    """Get a cursor walk specialized to the language's configured node types."""
+    if language in _walker_cache:
+        return _walker_cache[language]
     
-    visit_node(root_node(tree))
-    return symbols
+    config = get_language_config(language)
+    if not config:
+        return None
+    
+    source = _WALKER_TEMPLATE.format(
+        class_test=_node_type_test(config.class_nodes),
+        function_test=_node_type_test(config.function_nodes - config.class_nodes),
+    )
+    namespace = {
+        "cursor_node": cursor_node,
+        "node_type": node_type,
+        "_extract_class_symbol": _extract_class_symbol,
+        "_extract_function_symbol": _extract_function_symbol,
+    }
+    exec(compile(source, f"<fancy_tree walker: {language}>", "exec"), namespace)
+    
+    _walker_cache[language] = namespace["walk"]
+    return namespace["walk"]
 
 
-def _extract_class_symbol(node, source_code: str, config, extractor, language: str) -> Optional[Symbol]:
+def _extract_class_symbol(node, source_bytes: bytes, config, extractor, language: str,
+                          verbose: bool = False) -> Optional[Symbol]:
     """Extract class symbol using generic approach."""
-    name = _extract_name_from_node(node, source_code, config)
+    name = _extract_name_from_node(node, source_bytes, config)
     if not name:
         return None
     
     # Get signature using language-specific extractor
     try:
         template = config.get_template("class")
-        signature = extractor.extract_class_signature(node, source_code, template)
+        signature = extractor.extract_class_signature(node, source_bytes, template)
     except Exception as e:
-        console.print(f"WARNING: Signature extraction failed for class {name}: {e}")
+        if verbose:
+            console.print(f"WARNING: Signature extraction failed for class {name}: {e}")
         signature = f"class {name}"
     
-    return Symbol(
-        name=name,
-        type=SymbolType.CLASS,
-        line=node_start_line(node),
-        signature=signature,
-        language=language
-    )
+    return Symbol(name, SymbolType.CLASS, node_start_line(node), signature, language)
 
 
-def _extract_interface_symbol(node, source_code: str, config, extractor, language: str) -> Optional[Symbol]:
+def _extract_interface_symbol(node, source_bytes: bytes, config, extractor, language: str,
+                              verbose: bool = False) -> Optional[Symbol]:
     """Extract interface symbol using generic approach."""
-    name = _extract_name_from_node(node, source_code, config)
+    name = _extract_name_from_node(node, source_bytes, config)
     if not name:
         return None
     
     try:
         template = config.get_template("interface")
-        signature = extractor.extract_class_signature(node, source_code, template)  # Reuse class extractor
+        signature = extractor.extract_class_signature(node, source_bytes, template)  # Reuse class extractor
     except Exception as e:
-        console.print(f"⚠️ Signature extraction failed for interface {name}: {e}")
+        if verbose:
+            console.print(f"⚠️ Signature extraction failed for interface {name}: {e}")
         signature = f"interface {name}"
     
-    return Symbol(
-        name=name,
-        type=SymbolType.INTERFACE,
-        line=node_start_line(node),
-        signature=signature,
-        language=language
-    )
+    return Symbol(name, SymbolType.INTERFACE, node_start_line(node), signature, language)
 
 
-def _extract_function_symbol(node, source_code: str, config, extractor, language: str, inside_class: bool) -> Optional[Symbol]:
+def _extract_function_symbol(node, source_bytes: bytes, config, extractor, language: str, inside_class: bool,
+                             verbose: bool = False) -> Optional[Symbol]:
     """Extract function/method symbol using generic approach."""
-    name = _extract_name_from_node(node, source_code, config)
+    name = _extract_name_from_node(node, source_bytes, config)
     if not name:
         return None
     
@@ -216,37 +457,34 @@ def _extract_function_symbol(node, source_code: str, config, extractor, language
     
     # Extract signature using language-specific extractor
     try:
-        signature = extractor.extract_function_signature(node, source_code, template)
+        signature = extractor.extract_function_signature(node, source_bytes, template)
     except Exception as e:
-        console.print(f"⚠️ Signature extraction failed for {template_key} {name}: {e}")
+        if verbose:
+            console.print(f"⚠️ Signature extraction failed for {template_key} {name}: {e}")
         fallback = "def " if language == "python" else ""
         signature = f"{fallback}{name}(...)"
     
-    return Symbol(
-        name=name,
-        type=symbol_type,
-        line=node_start_line(node),
-        signature=signature,
-        language=language
-    )
+    return Symbol(name, symbol_type, node_start_line(node), signature, language)
 
 
-def _extract_name_from_node(node, source_code: str, config) -> Optional[str]:
+def _extract_name_from_node(node, source_bytes: bytes, config) -> Optional[str]:
     """Extract name from node using configured name node types."""
     for child in node_children(node):
         if node_type(child) in config.name_nodes:
-            return node_text(child, source_code)
+            return node_text(child, source_bytes)
     
     return None
 
 
-def extract_symbols_from_file(file_path: Path, language: str) -> List[Symbol]:
+def extract_symbols_from_file(file_path: Path, language: str, use_cache: bool = False,
+                              verbose: bool = False) -> List[Symbol]:
     """Extract symbols from a single file."""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            source_code = f.read()
+        # Binary read: skips a full decode only to re-encode for the parser
+        with open(file_path, 'rb') as f:
+            source_bytes = f.read()
         
-        return extract_symbols_generic(source_code, language)
+        return extract_symbols_from_bytes(source_bytes, language, use_cache, verbose)
         
     except Exception as e:
         console.print(f"ERROR: Error reading {file_path}: {e}")
@@ -267,22 +505,28 @@ def flatten_to_top_level(symbols: List[Symbol]) -> List[Symbol]:
     flattened = []
     for symbol in symbols:
         # Create a copy of the symbol without children
-        top_level_symbol = Symbol(
-            name=symbol.name,
-            type=symbol.type,
-            line=symbol.line,
-            signature=symbol.signature,
-            language=symbol.language,
-            children=[]  # Remove all children
-        )
+        top_level_symbol = Symbol(symbol.name, symbol.type, symbol.line, symbol.signature, symbol.language, [])
         flattened.append(top_level_symbol)
     return flattened
 
 
-def process_file(file_path: Path, language: str, max_lines: Optional[int] = 25) -> FileInfo:
+def process_file(file_path: Path, language: str, max_lines: Optional[int] = 25,
+                 use_cache: bool = False, verbose: bool = False) -> FileInfo:
     """Process a single file and return FileInfo."""
-    symbols = extract_symbols_from_file(file_path, language)
-    lines = count_lines(file_path)
+    # Read once and reuse the bytes for both line counting and parsing
+    try:
+        source_bytes = file_path.read_bytes()
+    except OSError as e:
+        console.print(f"ERROR: Error reading {file_path}: {e}")
+        source_bytes = b""
+    
+    try:
+        symbols = extract_symbols_from_bytes(source_bytes, language, use_cache, verbose) if source_bytes else []
+    except Exception as e:
+        # Keep the file in the tree, just without symbols
+        console.print(f"ERROR: Error extracting symbols from {file_path}: {e}")
+        symbols = []
+    lines = count_lines_in_bytes(source_bytes)
     
     # Check if the output would be too long
     output_lines = count_symbol_output_lines(symbols)
@@ -291,9 +535,7 @@ def process_file(file_path: Path, language: str, max_lines: Optional[int] = 25)
         symbols = flatten_to_top_level(symbols)
     
     # Check if language has signature support
-    config = get_language_config(language)
-    extractor = get_signature_extractor(language)
-    has_signature_support = config is not None and not isinstance(extractor, type(extractor)) or hasattr(extractor, 'language')
+    has_signature_support = language in SIGNATURE_SUPPORTED_LANGUAGES
     
     return FileInfo(
         path=str(file_path),
@@ -304,6 +546,70 @@ def process_file(file_path: Path, language: str, max_lines: Optional[int] = 25)
     )
 
 
+def _process_task(task: Tuple[Path, str, Optional[int]], use_cache: bool = False,
+                  verbose: bool = False) -> Optional[FileInfo]:
+    """Process one (file_path, language, max_lines) task; report errors and return None."""
+    file_path, language, max_lines = task
+    try:
+        return process_file(file_path, language, max_lines, use_cache, verbose)
+    except Exception as e:
+        console.print(f"ERROR: Error processing {file_path}: {e}")
+        return None
+
+
+def _process_batch(batch: List[Tuple[int, Tuple[Path, str, Optional[int]]]],
+                   use_cache: bool = False, verbose: bool = False) -> List[Tuple[int, Optional[FileInfo]]]:
+    """Process one worker's share of (index, task) pairs, keeping each task's index."""
+    return [(index, _process_task(task, use_cache, verbose)) for index, task in batch]
+
+
+def _balance_tasks(indices: List[int], sizes: List[int], workers: int) -> List[List[int]]:
+    """
+    Split task indices into per-worker batches of roughly equal byte size.
+
+    Longest-processing-time schedule: the largest remaining file always goes
+    to the worker with the smallest byte total, so one huge file can't leave
+    a single worker running long after the others are done.
+    """
+    batches: List[List[int]] = [[] for _ in range(max(1, min(workers, len(indices))))]
+    heap = [(0, worker) for worker in range(len(batches))]
+    for index in sorted(indices, key=sizes.__getitem__, reverse=True):
+        total, worker = heapq.heappop(heap)
+        batches[worker].append(index)
+        heapq.heappush(heap, (total + sizes[index], worker))
+    return batches
+
+
+def _pool_min_bytes() -> int:
+    """Total source size below which files are parsed in the calling process."""
+    return POOL_MIN_BYTES.get(multiprocessing.get_start_method(), max(POOL_MIN_BYTES.values()))
+
+
+def _file_size(file_path: Path) -> int:
+    """Return the file size in bytes, or 0 if it can't be read."""
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
+
+
+def _relative_path(file_path: Path, repo_prefix: str) -> str:
+    """
+    Return *file_path* relative to the repository root as a plain string.
+
+    *repo_prefix* is the resolved root with a trailing separator. Discovered
+    files are already under it, so a string slice replaces the per-file
+    resolve() + relative_to() PurePath round-trip.
+    """
+    file_str = os.fspath(file_path)
+    if not file_str.startswith(repo_prefix):
+        file_str = os.path.realpath(file_str)
+        if not file_str.startswith(repo_prefix):
+            # Fallback if paths are incompatible
+            return os.path.basename(file_str)
+    return file_str[len(repo_prefix):]
+
+
 def _get_or_create_dir(root: DirectoryInfo, parts: list[str]) -> DirectoryInfo:
     """
     Walk / create sub‑DirectoryInfo objects for the given relative‑path parts
@@ -328,16 +634,24 @@ def _get_or_create_dir(root: DirectoryInfo, parts: list[str]) -> DirectoryInfo:
 def process_repository(repo_path: Path, 
                       language_filter: Optional[List[str]] = None,
                       max_files: Optional[int] = None,
-                      max_lines: Optional[int] = 25) -> RepoSummary:
+                      max_lines: Optional[int] = 25,
+                      use_cache: bool = False,
+                      verbose: bool = False,
+                      show_progress: bool = True) -> RepoSummary:
     """
     Main orchestration function - processes entire repository.
     
     This is the high-level entry point that coordinates everything.
+    
+    Repositories with at least POOL_MIN_BYTES of source are parsed in a
+    process pool in size-balanced batches; smaller ones in this process.
     """
-    console.print(f"Processing repository with fancy_tree...")
+    if verbose:
+        console.print(f"Processing repository with fancy_tree...")
     
     # Scan repository
-    scan_results = scan_repository(repo_path, language_filter, max_files)
+    # process_file reads every classified file anyway, so count lines there
+    scan_results = scan_repository(repo_path, language_filter, max_files, count_total_lines=False)
     
     # Check language availability and offer installation
     from .config import show_language_status_and_install
@@ -361,70 +675,97 @@ def process_repository(repo_path: Path,
         classified_file_set.update(file_list)
     unclassified_files = [f for f in all_files if f not in classified_file_set]
     
+    # Resolve the root once; discovered files already live under it
+    repo_prefix = os.path.join(os.fspath(Path(repo_path).resolve()), "")
+    
     # Process files by language
     supported_languages = {}
     total_processed = 0
+    total_lines = 0
     
+    tasks = []
     for language, file_list in classified_files.items():
-        console.print(f"Processing {len(file_list)} {language} files...")
+        if verbose:
+            console.print(f"Processing {len(file_list)} {language} files...")
         
         # Check if language is supported
         lang_info = availability.get(language, {})
         is_supported = lang_info.get("parser_available", False)
         supported_languages[language] = is_supported
         
-        for file_path in file_list:
-            try:
-                # Make path relative to repo root
-                try:
-                    # Ensure both paths are absolute
-                    abs_file = file_path.resolve()
-                    abs_repo = repo_path.resolve()
-                    rel_path = abs_file.relative_to(abs_repo)
-                except ValueError:
-                    # Fallback if paths are incompatible
-                    rel_path = Path(file_path.name)
-                
-                file_info = process_file(file_path, language, max_lines)
-                file_info.path = str(rel_path)
-                
-                # Build proper directory tree
-                rel_parts = list(rel_path.parts)           # e.g. ['src', 'main', 'App.java']
-                file_name = rel_parts.pop()                # keep the filename, pop directories
-                target_dir = _get_or_create_dir(root_dir, rel_parts)
-                target_dir.files.append(file_info)
-                
-                total_processed += 1
-                
-            except Exception as e:
-                console.print(f"ERROR: Error processing {file_path}: {e}")
-                continue
+        tasks.extend((file_path, language, max_lines) for file_path in file_list)
+    
+    # Import the grammars once up front so forked workers inherit them
+    for language in classified_files:
+        get_parser_for_language(language, verbose)
+    
+    # Parse time is roughly linear in file size, so balance batches by bytes
+    sizes = [_file_size(task[0]) for task in tasks]
+    workers = os.cpu_count() or 1
+    
+    results: List[Optional[FileInfo]] = [None] * len(tasks)
+    with Progress(console=console, transient=True, disable=not show_progress) as progress:
+        progress_task = progress.add_task("Processing files", total=len(tasks))
+        if workers == 1 or sum(sizes) < _pool_min_bytes():
+            for index, task in enumerate(tasks):
+                results[index] = _process_task(task, use_cache, verbose)
+                progress.advance(progress_task)
+        else:
+            # Parsing and symbol assembly are CPU-bound, and if the binding
+            # holds the GIL in parser.parse threads would run them one at a
+            # time, so spread the files across processes
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_process_batch, [(index, tasks[index]) for index in batch], use_cache, verbose)
+                    for batch in _balance_tasks(list(range(len(tasks))), sizes, workers)
+                ]
+                for future in as_completed(futures):
+                    batch_results = future.result()
+                    for index, file_info in batch_results:
+                        results[index] = file_info
+                    progress.advance(progress_task, len(batch_results))
+    
+    for (file_path, language, _), file_info in zip(tasks, results):
+        if file_info is None:
+            continue
+        
+        # Make path relative to repo root
+        rel_path = _relative_path(file_path, repo_prefix)
+        file_info.path = rel_path
+        
+        # Build proper directory tree
+        rel_parts = rel_path.split(os.sep)         # e.g. ['src', 'main', 'App.java']
+        file_name = rel_parts.pop()                # keep the filename, pop directories
+        target_dir = _get_or_create_dir(root_dir, rel_parts)
+        target_dir.files.append(file_info)
+        
+        total_processed += 1
+        total_lines += file_info.lines
     
     # ----------------------------------------------------------
     # Attach files that didn't match any language
     # ----------------------------------------------------------
     for file_path in unclassified_files:
-        try:
-            rel_path = file_path.resolve().relative_to(repo_path.resolve())
-        except ValueError:
-            rel_path = Path(file_path.name)
+        total_lines += count_lines(file_path)
+        rel_path = _relative_path(file_path, repo_prefix)
 
         # no symbols, no lines, no language
         file_info = FileInfo(
-            path=str(rel_path),
+            path=rel_path,
             language="other",
             lines=0,
             symbols=[],
             has_signature_support=False
         )
 
-        parts = list(rel_path.parts)
+        parts = rel_path.split(os.sep)
         if parts:
             parts.pop()                                   # drop the filename
         _get_or_create_dir(root_dir, parts).files.append(file_info)
         total_processed += 1
     
-    console.print(f"Processed {total_processed} files")
+    if verbose:
+        console.print(f"Processed {total_processed} files")
     
     # Create repository summary
     repo_summary = RepoSummary(
@@ -434,7 +775,7 @@ def process_repository(repo_path: Path,
         languages=scan_results["language_counts"],
         supported_languages=supported_languages,
         total_files=scan_results["total_files"],
-        total_lines=scan_results["total_lines"]
+        total_lines=total_lines
     )
     
     return repo_summary
@@ -5,7 +5,23 @@ from __future__ import annotations
 from typing import List, Dict
 from pathlib import Path
 from ..schema import RepoSummary, DirectoryInfo, FileInfo, Symbol, SymbolType
-from collections import defaultdict
+from itertools import groupby
+from operator import attrgetter
+
+# Precomputed indentation strings, indexed by depth
+_INDENTS = ["  " * depth for depth in range(64)]
+
+# Fallback prefixes for symbols without a signature
+_SYMBOL_PREFIXES = {
+    SymbolType.CLASS: "class ",
+    SymbolType.INTERFACE: "interface ",
+    SymbolType.FUNCTION: "function ",
+    SymbolType.METHOD: "method ",
+    SymbolType.ENUM: "enum ",
+    SymbolType.CONSTRUCTOR: "constructor ",
+    SymbolType.FIELD: "field ",
+    SymbolType.VARIABLE: "var "
+}
 
 
 class EnhancedTreeFormatter:
@@ -17,18 +33,20 @@ class EnhancedTreeFormatter:
     
     def format_repository(self, repo_summary: RepoSummary) -> str:
         """Format entire repository with language grouping."""
-        lines = []
-        
         # Repository header
-        lines.append(f"Repository: {repo_summary.name}")
-        lines.append(f"Total files: {repo_summary.total_files}, Total lines: {repo_summary.total_lines}")
-        lines.append("")
+        lines = [
+            f"Repository: {repo_summary.name}",
+            f"Total files: {repo_summary.total_files}, Total lines: {repo_summary.total_lines}",
+            "",
+            "Language Support:",
+        ]
         
         # Language support status
-        lines.append("Language Support:")
-        for lang, count in repo_summary.languages.items():
-            support_status = "SUPPORTED" if repo_summary.supported_languages.get(lang, False) else "NOT_SUPPORTED"
-            lines.append(f"  {lang}: {count} files ({support_status})")
+        supported = repo_summary.supported_languages
+        lines.extend(
+            f"  {lang}: {count} files ({'SUPPORTED' if supported.get(lang, False) else 'NOT_SUPPORTED'})"
+            for lang, count in repo_summary.languages.items()
+        )
         lines.append("")
         
         if self.group_by_language:
@@ -42,27 +60,28 @@ class EnhancedTreeFormatter:
         """Format grouped by language."""
         lines = []
 
-        files_by_language = defaultdict(list)
-
-        # walk the whole tree
-        def walk(dir_info):
-            for f in dir_info.files:
-                files_by_language[f.language].append(f)
-            for sub in dir_info.subdirs:
-                walk(sub)
+        # walk the whole tree (same order as a recursive pre-order walk)
+        all_files = []
+        stack = [repo_summary.structure]
+        while stack:
+            dir_info = stack.pop()
+            all_files.extend(dir_info.files)
+            stack.extend(reversed(dir_info.subdirs))
 
-        walk(repo_summary.structure)
+        # stable sort keeps the natural file order within each language
+        all_files.sort(key=attrgetter('language'))
         
         # Format each language group
-        for language in sorted(files_by_language.keys()):
-            files = files_by_language[language]
+        format_file = self._format_file
+        for language, group in groupby(all_files, key=attrgetter('language')):
+            files = list(group)
             support_status = "SUPPORTED" if repo_summary.supported_languages.get(language, False) else "NOT_SUPPORTED"
             
             lines.append(f"{language.upper()} Files ({len(files)} files, {support_status}):")
             
             # Keep natural file ordering - remove sorted()
             for file_info in files:
-                self._format_file(file_info, lines, 1)
+                format_file(file_info, lines, 1)
             
             lines.append("")  # Empty line between languages
         
@@ -80,22 +99,30 @@ class EnhancedTreeFormatter:
         lines: list[str],
         depth: int
     ) -> None:
-        indent = self._indent(depth)
-
-        # sort once, case‑insensitive – this is exactly what `tree` does
-        subdirs = sorted(dir_info.subdirs, key=lambda d: d.name.lower())
-        files   = sorted(dir_info.files,   key=lambda f: Path(f.path).name.lower())
-
-        # ── 1. directories first ─────────────────────────────
-        for sub in subdirs:
-            lines.append(f"{indent}{sub.name}/")
-            self._format_directory(sub, lines, depth + 1)
+        lines_append = lines.append
+        format_file = self._format_file
+
+        # explicit (item, depth, is_file) stack instead of recursion
+        stack = [(dir_info, depth, False)]
+        while stack:
+            item, item_depth, is_file = stack.pop()
+            if is_file:
+                format_file(item, lines, item_depth)
+                continue
+
+            if item is not dir_info:
+                lines_append(f"{self._indent(item_depth - 1)}{item.name}/")
+
+            # sort once, case‑insensitive – this is exactly what `tree` does
+            subdirs = sorted(item.subdirs, key=lambda d: d.name.lower())
+            files   = sorted(item.files,   key=lambda f: Path(f.path).name.lower())
+
+            # pushed in reverse so that they pop in order:
+            # ── 1. directories first ─────────────────────────────
+            # ── 2. files afterwards ─────────────────────────────
+            stack.extend((f, item_depth, True) for f in reversed(files))
+            stack.extend((sub, item_depth + 1, False) for sub in reversed(subdirs))
 
-        # ── 2. files afterwards ─────────────────────────────
-        for f in files:
-            self._format_file(f, lines, depth)
-
-    
     def _format_file(self,
                     file_info: FileInfo,
                     lines: List[str],
@@ -112,30 +139,43 @@ class EnhancedTreeFormatter:
         lines.append(f"{indent}{filename} ({file_info.language}, "
                     f"{file_info.lines} lines)")
 
+        format_symbol = self._format_symbol
         for sym in file_info.symbols:
-            self._format_symbol(sym, lines, depth + 1)
+            format_symbol(sym, lines, depth + 1)
     
     def _format_symbol(self, symbol: Symbol, lines: List[str], depth: int):
         """Format symbol with enhanced signature display."""
-        # Use signature if available, otherwise construct from type and name
-        if symbol.signature:
-            symbol_line = symbol.signature
-        else:
-            prefix = self._get_symbol_prefix(symbol.type)
-            symbol_line = f"{prefix}{symbol.name}"
-        
-        # Fix multiline indentation
-        base_indent = self._indent(depth)
-        symbol_line = self._fix_multiline_indentation(symbol_line, base_indent)
-        
-        # Remove line number from pretty output (kept in JSON)
-        # symbol_line += f"  # line {symbol.line}"
-        
-        lines.append(base_indent + symbol_line)
-        
-        # Format child symbols
-        for child in symbol.children:
-            self._format_symbol(child, lines, depth + 1)
+        # bound once: this loop runs for every symbol in the repository
+        lines_append = lines.append
+        indent = self._indent
+        fix_multiline_indentation = self._fix_multiline_indentation
+
+        # explicit (symbol, depth) stack instead of recursing into children
+        stack = [(symbol, depth)]
+        stack_pop = stack.pop
+        stack_extend = stack.extend
+        while stack:
+            symbol, depth = stack_pop()
+
+            # Use signature if available, otherwise construct from type and name
+            if symbol.signature:
+                symbol_line = symbol.signature
+            else:
+                prefix = _SYMBOL_PREFIXES.get(symbol.type, "")
+                symbol_line = f"{prefix}{symbol.name}"
+
+            # Fix multiline indentation
+            base_indent = indent(depth)
+            symbol_line = fix_multiline_indentation(symbol_line, base_indent)
+
+            # Remove line number from pretty output (kept in JSON)
+            # symbol_line += f"  # line {symbol.line}"
+
+            lines_append(base_indent + symbol_line)
+
+            # Format child symbols (reversed so they pop in source order)
+            if symbol.children:
+                stack_extend((child, depth + 1) for child in reversed(symbol.children))
 
     def _fix_multiline_indentation(self, signature: str, base_indent: str) -> str:
         """Fix multiline signature indentation to maintain minimum base indentation."""
@@ -157,20 +197,12 @@ class EnhancedTreeFormatter:
     
     def _get_symbol_prefix(self, symbol_type: SymbolType) -> str:
         """Get prefix for different symbol types."""
-        prefixes = {
-            SymbolType.CLASS: "class ",
-            SymbolType.INTERFACE: "interface ",
-            SymbolType.FUNCTION: "function ",
-            SymbolType.METHOD: "method ",
-            SymbolType.ENUM: "enum ",
-            SymbolType.CONSTRUCTOR: "constructor ",
-            SymbolType.FIELD: "field ",
-            SymbolType.VARIABLE: "var "
-        }
-        return prefixes.get(symbol_type, "")
+        return _SYMBOL_PREFIXES.get(symbol_type, "")
     
     def _indent(self, depth: int) -> str:
         """Generate indentation string."""
+        if depth < len(_INDENTS):
+            return _INDENTS[depth]
         return "  " * depth
 
 
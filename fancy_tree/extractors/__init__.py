@@ -1,6 +1,15 @@
 """Signature extractor registry and initialization."""
 
-from .base import SignatureExtractor, register_extractor, get_signature_extractor, list_supported_languages
+from typing import FrozenSet
+
+from .base import (
+    SIGNATURE_EXTRACTORS,
+    NotImplementedExtractor,
+    SignatureExtractor,
+    register_extractor,
+    get_signature_extractor,
+    list_supported_languages,
+)
 from .python import PythonExtractor
 from .typescript import TypeScriptExtractor
 from .java import JavaExtractor
@@ -32,10 +41,18 @@ def initialize_extractors():
 # Auto-initialize when module is imported
 initialize_extractors()
 
+# Languages with a real (not fallback) signature extractor, computed once
+SIGNATURE_SUPPORTED_LANGUAGES: FrozenSet[str] = frozenset(
+    language
+    for language, extractor in SIGNATURE_EXTRACTORS.items()
+    if not isinstance(extractor, NotImplementedExtractor)
+)
+
 __all__ = [
     "SignatureExtractor",
     "get_signature_extractor", 
     "list_supported_languages",
+    "SIGNATURE_SUPPORTED_LANGUAGES",
     "PythonExtractor",
     "TypeScriptExtractor", 
     "JavaExtractor"
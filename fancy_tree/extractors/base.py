@@ -46,16 +46,16 @@ class SignatureExtractor(ABC):
     """Abstract base class for language-specific signature extractors."""
     
     @abstractmethod
-    def extract_function_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_function_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract function signature using language-specific logic."""
         pass
     
     @abstractmethod
-    def extract_class_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_class_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract class signature using language-specific logic."""
         pass
     
-    def extract_method_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_method_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract method signature (defaults to function signature)."""
         return self.extract_function_signature(node, source_code, template)
 
@@ -71,7 +71,7 @@ class SignatureExtractor(ABC):
         else:
             source_bytes = source_code
 
-        return source_bytes[node_start_byte(node):node_end_byte(node)].decode("utf-8")
+        return source_bytes[node_start_byte(node):node_end_byte(node)].decode("utf-8", "replace")
 
     def node_type(self, node: Node) -> str:
         """Return the node kind across tree-sitter Node API versions."""
@@ -107,17 +107,17 @@ class NotImplementedExtractor(SignatureExtractor):
     def __init__(self, language: str):
         self.language = language
     
-    def extract_function_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_function_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Return basic signature without language-specific logic."""
         name = self._extract_basic_name(node, source_code)
         return template.format(name=name, params="...", return_type="", visibility="")
     
-    def extract_class_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_class_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Return basic class signature without language-specific logic."""
         name = self._extract_basic_name(node, source_code)
         return template.format(name=name, visibility="")
     
-    def _extract_basic_name(self, node: Node, source_code: str) -> str:
+    def _extract_basic_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract name using basic heuristics."""
         # Try to find identifier nodes
         for child in self.node_children(node):
@@ -2,13 +2,13 @@
 
 from .base import SignatureExtractor
 from tree_sitter import Node
-from typing import Optional
+from typing import Optional, Union
 
 
 class CExtractor(SignatureExtractor):
     """C signature extractor for functions, structs, and enums."""
     
-    def extract_function_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_function_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract C function signature."""
         name = self._get_function_name(node, source_code)
         params = self._get_parameters(node, source_code)
@@ -19,7 +19,7 @@ class CExtractor(SignatureExtractor):
         else:
             return f"{name}({params})"
     
-    def extract_class_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_class_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract C struct or enum signature."""
         name = self._get_struct_name(node, source_code)
         
@@ -32,7 +32,7 @@ class CExtractor(SignatureExtractor):
         else:
             return f"type {name}"
     
-    def _get_function_name(self, node: Node, source_code: str) -> str:
+    def _get_function_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract function name."""
         # For function_definition, look for function_declarator
         if self.node_type(node) == "function_definition":
@@ -49,14 +49,14 @@ class CExtractor(SignatureExtractor):
         
         return "unknown_function"
     
-    def _get_struct_name(self, node: Node, source_code: str) -> str:
+    def _get_struct_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract struct/enum name."""
         identifier = self.find_child_by_type(node, "type_identifier")
         if identifier:
             return self.get_node_text(identifier, source_code)
         return "anonymous"
     
-    def _get_parameters(self, node: Node, source_code: str) -> str:
+    def _get_parameters(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract function parameters."""
         # Look for parameter_list in function_declarator
         declarator = self.find_child_by_type(node, "function_declarator")
@@ -67,7 +67,7 @@ class CExtractor(SignatureExtractor):
                 return params_text.strip("()")
         return ""
     
-    def _get_return_type(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_return_type(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract return type."""
         # For function_definition, the first child is usually the return type
         children = self.node_children(node)
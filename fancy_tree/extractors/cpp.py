@@ -2,13 +2,13 @@
 
 from .base import SignatureExtractor
 from tree_sitter import Node
-from typing import Optional
+from typing import Optional, Union
 
 
 class CppExtractor(SignatureExtractor):
     """C++ signature extractor for functions, classes, and structs."""
     
-    def extract_function_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_function_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract C++ function signature."""
         name = self._get_function_name(node, source_code)
         params = self._get_parameters(node, source_code)
@@ -19,7 +19,7 @@ class CppExtractor(SignatureExtractor):
         else:
             return f"{name}({params})"
     
-    def extract_class_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_class_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract C++ class or struct signature."""
         name = self._get_class_name(node, source_code)
         inheritance = self._get_inheritance(node, source_code)
@@ -39,7 +39,7 @@ class CppExtractor(SignatureExtractor):
         else:
             return f"type {name}"
     
-    def _get_function_name(self, node: Node, source_code: str) -> str:
+    def _get_function_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract function name."""
         if self.node_type(node) == "function_definition":
             declarator = self.find_child_by_type(node, "function_declarator")
@@ -54,14 +54,14 @@ class CppExtractor(SignatureExtractor):
         
         return "unknown_function"
     
-    def _get_class_name(self, node: Node, source_code: str) -> str:
+    def _get_class_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract class name."""
         identifier = self.find_child_by_type(node, "type_identifier")
         if identifier:
             return self.get_node_text(identifier, source_code)
         return "unknown_class"
     
-    def _get_parameters(self, node: Node, source_code: str) -> str:
+    def _get_parameters(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract function parameters."""
         declarator = self.find_child_by_type(node, "function_declarator")
         if declarator:
@@ -71,7 +71,7 @@ class CppExtractor(SignatureExtractor):
                 return params_text.strip("()")
         return ""
     
-    def _get_return_type(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_return_type(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract return type."""
         children = self.node_children(node)
         if self.node_type(node) == "function_definition" and children:
@@ -80,7 +80,7 @@ class CppExtractor(SignatureExtractor):
                 return self.get_node_text(first_child, source_code)
         return None
     
-    def _get_inheritance(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_inheritance(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract class inheritance."""
         base_class_clause = self.find_child_by_type(node, "base_class_clause")
         if base_class_clause:
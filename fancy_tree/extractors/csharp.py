@@ -2,13 +2,13 @@
 
 from .base import SignatureExtractor
 from tree_sitter import Node
-from typing import Optional
+from typing import Optional, Union
 
 
 class CsharpExtractor(SignatureExtractor):
     """C# signature extractor for methods, classes, and interfaces."""
     
-    def extract_function_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_function_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract C# method signature."""
         visibility = self._get_visibility(node, source_code)
         name = self._get_method_name(node, source_code)
@@ -24,7 +24,7 @@ class CsharpExtractor(SignatureExtractor):
         
         return " ".join(parts)
     
-    def extract_class_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_class_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract C# class or interface signature."""
         visibility = self._get_visibility(node, source_code)
         name = self._get_class_name(node, source_code)
@@ -48,7 +48,7 @@ class CsharpExtractor(SignatureExtractor):
         
         return " ".join(parts)
     
-    def _get_visibility(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_visibility(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract visibility modifier."""
         modifiers = self.find_child_by_type(node, "modifiers")
         if modifiers:
@@ -58,21 +58,21 @@ class CsharpExtractor(SignatureExtractor):
                     return text
         return None
     
-    def _get_method_name(self, node: Node, source_code: str) -> str:
+    def _get_method_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract method name."""
         identifier = self.find_child_by_type(node, "identifier")
         if identifier:
             return self.get_node_text(identifier, source_code)
         return "unknown_method"
     
-    def _get_class_name(self, node: Node, source_code: str) -> str:
+    def _get_class_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract class name."""
         identifier = self.find_child_by_type(node, "identifier")
         if identifier:
             return self.get_node_text(identifier, source_code)
         return "unknown_class"
     
-    def _get_parameters(self, node: Node, source_code: str) -> str:
+    def _get_parameters(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract method parameters."""
         param_list = self.find_child_by_type(node, "parameter_list")
         if param_list:
@@ -80,7 +80,7 @@ class CsharpExtractor(SignatureExtractor):
             return params_text.strip("()")
         return ""
     
-    def _get_return_type(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_return_type(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract return type."""
         # Look for type before the method name
         for child in self.node_children(node):
@@ -88,7 +88,7 @@ class CsharpExtractor(SignatureExtractor):
                 return self.get_node_text(child, source_code)
         return None
     
-    def _get_inheritance(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_inheritance(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract class inheritance."""
         base_list = self.find_child_by_type(node, "base_list")
         if base_list:
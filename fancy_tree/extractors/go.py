@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from tree_sitter import Node
 from .base import SignatureExtractor
-from typing import Optional
+from typing import Optional, Union
 
 
 class GoExtractor(SignatureExtractor):
@@ -13,7 +13,7 @@ class GoExtractor(SignatureExtractor):
     # —————————————————— public API —————————————————— #
 
     def extract_function_signature(
-        self, node: Node, source_code: str, template: str
+        self, node: Node, source_code: Union[str, bytes], template: str
     ) -> str:
         """Extract Go func / method signature with receiver and return type(s)."""
         recv      = self._get_receiver(node, source_code)
@@ -27,7 +27,7 @@ class GoExtractor(SignatureExtractor):
             return f"func {name}({params}) {ret_types}".rstrip()
 
     def extract_class_signature(
-        self, node: Node, source_code: str, template: str
+        self, node: Node, source_code: Union[str, bytes], template: str
     ) -> str:
         """
         Extract Go 'type' declarations.
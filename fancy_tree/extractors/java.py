@@ -2,13 +2,13 @@
 
 from .base import SignatureExtractor
 from tree_sitter import Node
-from typing import Optional, List
+from typing import Optional, List, Union
 
 
 class JavaExtractor(SignatureExtractor):
     """Java signature extractor for methods and classes."""
     
-    def extract_function_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_function_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract Java method signature with modifiers, return type, and parameters."""
         modifiers = self._get_modifiers(node, source_code)
         return_type = self._get_return_type(node, source_code)
@@ -24,7 +24,7 @@ class JavaExtractor(SignatureExtractor):
         
         return " ".join(parts)
     
-    def extract_class_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_class_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract Java class signature with modifiers and inheritance."""
         modifiers = self._get_modifiers(node, source_code)
         name = self._get_class_name(node, source_code)
@@ -40,7 +40,7 @@ class JavaExtractor(SignatureExtractor):
         
         return " ".join(parts)
     
-    def _get_modifiers(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_modifiers(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract access modifiers and other modifiers."""
         modifiers = []
         modifiers_node = self.find_child_by_type(node, "modifiers")
@@ -50,21 +50,21 @@ class JavaExtractor(SignatureExtractor):
                 modifiers.append(modifier_text)
         return " ".join(modifiers) if modifiers else None
     
-    def _get_method_name(self, node: Node, source_code: str) -> str:
+    def _get_method_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract method name."""
         name_node = self.find_child_by_type(node, "identifier")
         if name_node:
             return self.get_node_text(name_node, source_code)
         return "unknown_method"
     
-    def _get_class_name(self, node: Node, source_code: str) -> str:
+    def _get_class_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract class name."""
         name_node = self.find_child_by_type(node, "identifier")
         if name_node:
             return self.get_node_text(name_node, source_code)
         return "unknown_class"
     
-    def _get_parameters(self, node: Node, source_code: str) -> str:
+    def _get_parameters(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract method parameters with types."""
         params_node = self.find_child_by_type(node, "formal_parameters")
         if params_node:
@@ -72,7 +72,7 @@ class JavaExtractor(SignatureExtractor):
             return params_text.strip("()")
         return ""
     
-    def _get_return_type(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_return_type(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract return type."""
         # Look for type nodes
         for child in self.node_children(node):
@@ -80,7 +80,7 @@ class JavaExtractor(SignatureExtractor):
                 return self.get_node_text(child, source_code)
         return None
     
-    def _get_inheritance(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_inheritance(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract inheritance information."""
         parts = []
         
@@ -2,13 +2,13 @@
 
 from .base import SignatureExtractor
 from tree_sitter import Node
-from typing import Optional
+from typing import Optional, Union
 
 
 class JavaScriptExtractor(SignatureExtractor):
     """JavaScript signature extractor for functions, methods, and classes."""
     
-    def extract_function_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_function_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract JavaScript function signature."""
         name = self._get_function_name(node, source_code)
         params = self._get_parameters(node, source_code)
@@ -24,7 +24,7 @@ class JavaScriptExtractor(SignatureExtractor):
             # Regular function declaration
             return f"function {name}({params})"
     
-    def extract_class_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_class_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract JavaScript class signature."""
         name = self._get_class_name(node, source_code)
         inheritance = self._get_class_inheritance(node, source_code)
@@ -34,7 +34,7 @@ class JavaScriptExtractor(SignatureExtractor):
         else:
             return f"class {name}"
     
-    def _get_function_name(self, node: Node, source_code: str) -> str:
+    def _get_function_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract function or method name."""
         # Try different identifier types
         for child_type in ["identifier", "property_identifier"]:
@@ -43,7 +43,7 @@ class JavaScriptExtractor(SignatureExtractor):
                 return self.get_node_text(name_node, source_code)
         return "anonymous"
     
-    def _get_arrow_function_name(self, node: Node, source_code: str) -> str:
+    def _get_arrow_function_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract name for arrow functions from parent assignment."""
         # Check if parent is an assignment
         parent = node.parent
@@ -56,14 +56,14 @@ class JavaScriptExtractor(SignatureExtractor):
                 return self.get_node_text(identifier, source_code)
         return "anonymous"
     
-    def _get_class_name(self, node: Node, source_code: str) -> str:
+    def _get_class_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract class name."""
         name_node = self.find_child_by_type(node, "identifier")
         if name_node:
             return self.get_node_text(name_node, source_code)
         return "unknown_class"
     
-    def _get_parameters(self, node: Node, source_code: str) -> str:
+    def _get_parameters(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract function parameters."""
         params_node = self.find_child_by_type(node, "formal_parameters")
         if params_node:
@@ -71,7 +71,7 @@ class JavaScriptExtractor(SignatureExtractor):
             return params_text.strip("()")
         return ""
     
-    def _get_class_inheritance(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_class_inheritance(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract class inheritance."""
         heritage_clause = self.find_child_by_type(node, "class_heritage")
         if heritage_clause:
@@ -2,20 +2,20 @@
 
 from .base import SignatureExtractor
 from tree_sitter import Node
-from typing import Optional
+from typing import Optional, Union
 
 
 class PhpExtractor(SignatureExtractor):
     """PHP signature extractor for functions, methods, and classes."""
     
-    def extract_function_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_function_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract PHP function signature."""
         name = self._get_function_name(node, source_code)
         params = self._get_parameters(node, source_code)
         
         return f"function {name}({params})"
     
-    def extract_class_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_class_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract PHP class signature."""
         name = self._get_class_name(node, source_code)
         inheritance = self._get_inheritance(node, source_code)
@@ -32,21 +32,21 @@ class PhpExtractor(SignatureExtractor):
         else:
             return f"class {name}"
     
-    def _get_function_name(self, node: Node, source_code: str) -> str:
+    def _get_function_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract function name."""
         name_node = self.find_child_by_type(node, "name")
         if name_node:
             return self.get_node_text(name_node, source_code)
         return "unknown_function"
     
-    def _get_class_name(self, node: Node, source_code: str) -> str:
+    def _get_class_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract class name."""
         name_node = self.find_child_by_type(node, "name")
         if name_node:
             return self.get_node_text(name_node, source_code)
         return "unknown_class"
     
-    def _get_parameters(self, node: Node, source_code: str) -> str:
+    def _get_parameters(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract function parameters."""
         formal_params = self.find_child_by_type(node, "formal_parameters")
         if formal_params:
@@ -54,7 +54,7 @@ class PhpExtractor(SignatureExtractor):
             return params_text.strip("()")
         return ""
     
-    def _get_inheritance(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_inheritance(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract class inheritance."""
         base_clause = self.find_child_by_type(node, "base_clause")
         if base_clause:
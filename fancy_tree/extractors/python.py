@@ -2,13 +2,13 @@
 
 from .base import SignatureExtractor
 from tree_sitter import Node
-from typing import Optional, List
+from typing import Optional, List, Union
 
 
 class PythonExtractor(SignatureExtractor):
     """Python signature extractor with full support for functions, methods, and classes."""
     
-    def extract_function_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_function_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract Python function signature with parameters and return type."""
         name = self._get_function_name(node, source_code)
         params = self._get_parameters(node, source_code)
@@ -19,7 +19,7 @@ class PythonExtractor(SignatureExtractor):
         else:
             return f"def {name}({params})"
     
-    def extract_class_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_class_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract Python class signature with inheritance."""
         name = self._get_class_name(node, source_code)
         inheritance = self._get_inheritance(node, source_code)
@@ -29,35 +29,35 @@ class PythonExtractor(SignatureExtractor):
         else:
             return f"class {name}"
     
-    def _get_function_name(self, node: Node, source_code: str) -> str:
+    def _get_function_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract function name from function_definition node."""
         name_node = self.find_child_by_type(node, "identifier")
         if name_node:
             return self.get_node_text(name_node, source_code)
         return "unknown_function"
     
-    def _get_class_name(self, node: Node, source_code: str) -> str:
+    def _get_class_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract class name from class_definition node."""
         name_node = self.find_child_by_type(node, "identifier")
         if name_node:
             return self.get_node_text(name_node, source_code)
         return "unknown_class"
     
-    def _get_parameters(self, node: Node, source_code: str) -> str:
+    def _get_parameters(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract function parameters."""
         params_node = self.find_child_by_type(node, "parameters")
         if params_node:
             return self.get_node_text(params_node, source_code).strip("()")
         return ""
     
-    def _get_return_type(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_return_type(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract return type annotation if present."""
         for child in self.node_children(node):
             if self.node_type(child) == "type":
                 return self.get_node_text(child, source_code)
         return None
     
-    def _get_inheritance(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_inheritance(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract inheritance information from class."""
         argument_list = self.find_child_by_type(node, "argument_list")
         if argument_list:
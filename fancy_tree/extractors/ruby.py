@@ -2,13 +2,13 @@
 
 from .base import SignatureExtractor
 from tree_sitter import Node
-from typing import Optional
+from typing import Optional, Union
 
 
 class RubyExtractor(SignatureExtractor):
     """Ruby signature extractor for methods, classes, and modules."""
     
-    def extract_function_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_function_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract Ruby method signature."""
         name = self._get_method_name(node, source_code)
         params = self._get_parameters(node, source_code)
@@ -18,7 +18,7 @@ class RubyExtractor(SignatureExtractor):
         else:
             return f"def {name}"
     
-    def extract_class_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_class_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract Ruby class or module signature."""
         name = self._get_name(node, source_code)
         inheritance = self._get_inheritance(node, source_code)
@@ -33,7 +33,7 @@ class RubyExtractor(SignatureExtractor):
         else:
             return f"class {name}"
     
-    def _get_method_name(self, node: Node, source_code: str) -> str:
+    def _get_method_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract method name."""
         for child_type in ["identifier", "constant"]:
             name_node = self.find_child_by_type(node, child_type)
@@ -41,7 +41,7 @@ class RubyExtractor(SignatureExtractor):
                 return self.get_node_text(name_node, source_code)
         return "unknown_method"
     
-    def _get_name(self, node: Node, source_code: str) -> str:
+    def _get_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract class/module name."""
         for child_type in ["constant", "identifier"]:
             name_node = self.find_child_by_type(node, child_type)
@@ -49,7 +49,7 @@ class RubyExtractor(SignatureExtractor):
                 return self.get_node_text(name_node, source_code)
         return "unknown"
     
-    def _get_parameters(self, node: Node, source_code: str) -> str:
+    def _get_parameters(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract method parameters."""
         method_params = self.find_child_by_type(node, "method_parameters")
         if method_params:
@@ -57,7 +57,7 @@ class RubyExtractor(SignatureExtractor):
             return params_text.strip("()")
         return ""
     
-    def _get_inheritance(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_inheritance(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract class inheritance."""
         superclass = self.find_child_by_type(node, "superclass")
         if superclass:
@@ -2,13 +2,13 @@
 
 from .base import SignatureExtractor
 from tree_sitter import Node
-from typing import Optional
+from typing import Optional, Union
 
 
 class RustExtractor(SignatureExtractor):
     """Rust signature extractor for functions, structs, traits, and impls."""
     
-    def extract_function_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_function_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract Rust function signature."""
         name = self._get_function_name(node, source_code)
         params = self._get_parameters(node, source_code)
@@ -19,7 +19,7 @@ class RustExtractor(SignatureExtractor):
         else:
             return f"fn {name}({params})"
     
-    def extract_class_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_class_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract Rust struct, trait, or impl signature."""
         name = self._get_name(node, source_code)
         
@@ -32,14 +32,14 @@ class RustExtractor(SignatureExtractor):
         else:
             return f"type {name}"
     
-    def _get_function_name(self, node: Node, source_code: str) -> str:
+    def _get_function_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract function name."""
         name_node = self.find_child_by_type(node, "identifier")
         if name_node:
             return self.get_node_text(name_node, source_code)
         return "unknown_function"
     
-    def _get_name(self, node: Node, source_code: str) -> str:
+    def _get_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract type name."""
         for child_type in ["type_identifier", "identifier"]:
             name_node = self.find_child_by_type(node, child_type)
@@ -47,7 +47,7 @@ class RustExtractor(SignatureExtractor):
                 return self.get_node_text(name_node, source_code)
         return "unknown"
     
-    def _get_parameters(self, node: Node, source_code: str) -> str:
+    def _get_parameters(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract function parameters."""
         params_node = self.find_child_by_type(node, "parameters")
         if params_node:
@@ -55,7 +55,7 @@ class RustExtractor(SignatureExtractor):
             return params_text.strip("()")
         return ""
     
-    def _get_return_type(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_return_type(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract return type."""
         # Look for -> return_type pattern
         children = self.node_children(node)
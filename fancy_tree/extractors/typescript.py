@@ -2,13 +2,13 @@
 
 from .base import SignatureExtractor
 from tree_sitter import Node
-from typing import Optional, List
+from typing import Optional, List, Union
 
 
 class TypeScriptExtractor(SignatureExtractor):
     """TypeScript signature extractor for functions, methods, classes, and interfaces."""
     
-    def extract_function_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_function_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract TypeScript function signature."""
         name = self._get_function_name(node, source_code)
         params = self._get_parameters(node, source_code)
@@ -27,7 +27,7 @@ class TypeScriptExtractor(SignatureExtractor):
             else:
                 return f"function {name}({params})"
     
-    def extract_class_signature(self, node: Node, source_code: str, template: str) -> str:
+    def extract_class_signature(self, node: Node, source_code: Union[str, bytes], template: str) -> str:
         """Extract TypeScript class or interface signature."""
         name = self._get_class_name(node, source_code)
         
@@ -45,7 +45,7 @@ class TypeScriptExtractor(SignatureExtractor):
             else:
                 return f"class {name}"
     
-    def _get_function_name(self, node: Node, source_code: str) -> str:
+    def _get_function_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract function or method name."""
         # Try different identifier types
         for child_type in ["identifier", "property_identifier"]:
@@ -54,7 +54,7 @@ class TypeScriptExtractor(SignatureExtractor):
                 return self.get_node_text(name_node, source_code)
         return "unknown_function"
     
-    def _get_class_name(self, node: Node, source_code: str) -> str:
+    def _get_class_name(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract class or interface name."""
         for child_type in ["type_identifier", "identifier"]:
             name_node = self.find_child_by_type(node, child_type)
@@ -62,7 +62,7 @@ class TypeScriptExtractor(SignatureExtractor):
                 return self.get_node_text(name_node, source_code)
         return "unknown_class"
     
-    def _get_parameters(self, node: Node, source_code: str) -> str:
+    def _get_parameters(self, node: Node, source_code: Union[str, bytes]) -> str:
         """Extract function parameters with types."""
         params_node = self.find_child_by_type(node, "formal_parameters")
         if params_node:
@@ -70,7 +70,7 @@ class TypeScriptExtractor(SignatureExtractor):
             return params_text.strip("()")
         return ""
     
-    def _get_return_type(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_return_type(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract return type annotation."""
         type_annotation = self.find_child_by_type(node, "type_annotation")
         if type_annotation:
@@ -80,7 +80,7 @@ class TypeScriptExtractor(SignatureExtractor):
                     return self.get_node_text(child, source_code)
         return None
     
-    def _get_class_inheritance(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_class_inheritance(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract class inheritance."""
         heritage_clause = self.find_child_by_type(node, "class_heritage")
         if heritage_clause:
@@ -92,7 +92,7 @@ class TypeScriptExtractor(SignatureExtractor):
                         return self.get_node_text(child, source_code)
         return None
     
-    def _get_interface_inheritance(self, node: Node, source_code: str) -> Optional[str]:
+    def _get_interface_inheritance(self, node: Node, source_code: Union[str, bytes]) -> Optional[str]:
         """Extract interface inheritance."""
         heritage_clause = self.find_child_by_type(node, "extends_clause")
         if heritage_clause:
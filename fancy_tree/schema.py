@@ -5,6 +5,10 @@ from enum import Enum
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import json
+import sys
+
+# Slotted dataclasses need Python 3.10+; large repos hold 100k+ of these
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class SymbolType(Enum):
@@ -20,7 +24,7 @@ class SymbolType(Enum):
     TYPE_ALIAS = "type_alias"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Symbol:
     """A code symbol with enhanced multi-language support."""
     name: str
@@ -39,9 +43,20 @@ class Symbol:
             "language": self.language,
             "children": [child.to_dict() for child in self.children]
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Symbol':
+        return cls(
+            name=data["name"],
+            type=SymbolType(data["type"]),
+            line=data["line"],
+            signature=data.get("signature"),
+            language=data.get("language"),
+            children=[cls.from_dict(child) for child in data.get("children", [])]
+        )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FileInfo:
     """Enhanced file information with language metadata."""
     path: str  # Relative to repo root
@@ -60,7 +75,7 @@ class FileInfo:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DirectoryInfo:
     """Directory information with enhanced metadata."""
     path: str
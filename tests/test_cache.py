@@ -0,0 +1,66 @@
+"""Tests for fancy_tree.core.cache."""
+
+import pytest
+
+from fancy_tree.core import cache
+from fancy_tree.core.config import LanguageConfig
+from fancy_tree.schema import Symbol, SymbolType
+
+CONFIG = {
+    "function_nodes": ["function_definition"],
+    "class_nodes": ["class_definition"],
+    "name_nodes": ["identifier"],
+    "signature_templates": {"function": "def {name}({params})"},
+}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("FANCY_TREE_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_symbols_round_trip():
+    method = Symbol("f", SymbolType.METHOD, 2, "def f(self)", "python")
+    symbols = [
+        Symbol("A", SymbolType.CLASS, 1, "class A(Base)", "python", [method]),
+        Symbol("g", SymbolType.FUNCTION, 5, "def g(x: str = 'é')", "python"),
+    ]
+    key = cache.cache_key(b"source", LanguageConfig("python", CONFIG))
+
+    cache.store_symbols(key, symbols)
+
+    loaded = cache.load_symbols(key)
+    assert [s.to_dict() for s in loaded] == [s.to_dict() for s in symbols]
+    assert loaded[0].children[0].type is SymbolType.METHOD
+
+
+def test_missing_entry_returns_none():
+    assert cache.load_symbols(cache.cache_key(b"source", LanguageConfig("python", CONFIG))) is None
+
+
+@pytest.mark.parametrize("contents", ["{not json", '[{"name": "A"}]', '[{"name": "A", "type": "nope"}]'])
+def test_corrupt_entry_returns_none(contents):
+    key = cache.cache_key(b"source", LanguageConfig("python", CONFIG))
+    entry_path = cache._entry_path(key)
+    entry_path.parent.mkdir(parents=True)
+    entry_path.write_text(contents, encoding="utf-8")
+
+    assert cache.load_symbols(key) is None
+
+
+@pytest.mark.parametrize("field, value", [
+    ("name_nodes", ["identifier", "type_identifier"]),
+    ("signature_templates", {"function": "fn {name}({params})"}),
+])
+def test_key_changes_with_config(field, value):
+    base_key = cache.cache_key(b"source", LanguageConfig("python", CONFIG))
+    changed_key = cache.cache_key(b"source", LanguageConfig("python", {**CONFIG, field: value}))
+
+    assert changed_key != base_key
+
+
+def test_key_changes_with_source():
+    config = LanguageConfig("python", CONFIG)
+
+    assert cache.cache_key(b"a = 1", config) != cache.cache_key(b"a = 2", config)
@@ -0,0 +1,134 @@
+"""Tests for fancy_tree.core.extraction."""
+
+import pytest
+
+from fancy_tree.core import extraction
+from fancy_tree.core.config import get_language_config
+from fancy_tree.core.extraction import extract_symbols_from_bytes
+from fancy_tree.extractors import get_signature_extractor
+
+PYTHON_SOURCE = b"""\
+class A(
+    Base,
+):
+    def f(self,
+          x):
+        pass
+
+
+def g(x):
+    return x
+
+
+class B:
+    x = 1
+
+    def h(self):
+        pass
+"""
+
+
+def test_crlf_source_matches_lf():
+    crlf_source = PYTHON_SOURCE.replace(b"\n", b"\r\n")
+
+    lf_symbols = extract_symbols_from_bytes(PYTHON_SOURCE, "python")
+    crlf_symbols = extract_symbols_from_bytes(crlf_source, "python")
+
+    assert [s.to_dict() for s in crlf_symbols] == [s.to_dict() for s in lf_symbols]
+    assert crlf_symbols[0].signature == "class A(\n    Base,\n)"
+    assert crlf_symbols[0].children[0].signature == "def f(self,\n          x)"
+
+
+def test_process_file_keeps_file_when_extraction_fails(tmp_path, monkeypatch):
+    source_file = tmp_path / "a.py"
+    source_file.write_bytes(PYTHON_SOURCE)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("parse failed")
+
+    monkeypatch.setattr(extraction, "parse_tree", fail)
+    file_info = extraction.process_file(source_file, "python")
+
+    assert file_info.symbols == []
+    assert file_info.lines == PYTHON_SOURCE.count(b"\n")
+
+
+SOURCES = {
+    "python": PYTHON_SOURCE,
+    "javascript": b"""\
+class Shape {
+  area() { return 0; }
+  scale(factor) {
+    const apply = (x) => x * factor;
+    return apply;
+  }
+}
+
+function helper(a, b) {
+  return a + b;
+}
+""",
+    "rust": b"""\
+struct Point { x: i32 }
+
+impl Point {
+    fn new(x: i32) -> Self { Point { x } }
+}
+
+fn main() {
+    fn inner() {}
+}
+""",
+    "go": b"""\
+package main
+
+type Server struct{}
+
+func (s *Server) Start() error { return nil }
+
+func main() {}
+""",
+}
+
+
+def _query_and_walker_symbols(language, source_bytes, extra_captures=()):
+    config = get_language_config(language)
+    parser = extraction.get_parser_for_language(language)
+    extractor = get_signature_extractor(language)
+    tree = extraction.parse_tree(parser, source_bytes)
+
+    query = extraction.get_query_for_language(language, config)
+    assert query is not None
+    captures = extraction.query_captures(query, extraction.root_node(tree))
+    captures.extend(extra_captures)
+    from_query = extraction._symbols_from_captures(captures, source_bytes, config, extractor, language)
+
+    walker = extraction.get_walker_for_language(language)
+    from_walker = walker(tree, source_bytes, config, extractor, language, False)
+
+    return [s.to_dict() for s in from_query], [s.to_dict() for s in from_walker]
+
+
+@pytest.mark.parametrize("language", sorted(SOURCES))
+def test_query_and_walker_extract_the_same_symbols(language):
+    from_query, from_walker = _query_and_walker_symbols(language, SOURCES[language])
+
+    assert from_query
+    assert from_query == from_walker
+
+
+def test_captures_other_than_class_and_function_are_ignored():
+    if extraction.Query is None:
+        pytest.skip("tree_sitter.Query requires tree-sitter >= 0.23")
+
+    parser = extraction.get_parser_for_language("python")
+    tree = extraction.parse_tree(parser, PYTHON_SOURCE)
+    query = extraction.Query(
+        extraction.get_language_object("python"),
+        "(class_definition name: (identifier) @class.name body: (block) @class.body)",
+    )
+    stray_captures = extraction.query_captures(query, extraction.root_node(tree))
+
+    from_query, from_walker = _query_and_walker_symbols("python", PYTHON_SOURCE, stray_captures)
+
+    assert from_query == from_walker